@@ -1,5 +1,9 @@
+import asyncio
+import sys
+from dataclasses import dataclass
 from enum import Enum
-from typing import Awaitable, Callable, List, Optional, Tuple, TypeVar, Union, Iterator
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar, Union, Iterator
 
 from expression import Error, Result
 
@@ -19,13 +23,35 @@ class SelectorType(str, Enum):
     LINK_TEXT = "link_text"
 
 
+_STR_TO_TYPE: Dict[str, SelectorType] = {t.value: t for t in SelectorType}
+_TYPE_STR: Dict[SelectorType, str] = {t: t.value for t in SelectorType}
+
+
+def _to_selector_type(value: Union[SelectorType, str]) -> SelectorType:
+    """Resolve a selector type name such as "css" to its SelectorType member"""
+    if isinstance(value, SelectorType):
+        return value
+    return _STR_TO_TYPE.get(value) or SelectorType(value)
+
+
+@dataclass(frozen=True, slots=True)
 class Selector:
-    """Model representing a selector for finding elements"""
+    """
+    Model representing a selector for finding elements
 
-    def __init__(self, type: SelectorType, value: str, timeout: Optional[int] = None):
-        self.type = type
-        self.value = value
-        self.timeout = timeout
+    Selectors are immutable so that identical selectors can be shared
+    (see the cached ``css``/``xpath``/``text`` helpers).
+    """
+
+    type: SelectorType
+    value: str
+    timeout: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        # Normalize plain strings such as "css" to the enum member so that
+        # type checks can compare by identity
+        if not isinstance(self.type, SelectorType):
+            object.__setattr__(self, "type", _to_selector_type(self.type))
 
     def get_type(self) -> SelectorType:
         return self.type
@@ -34,19 +60,46 @@ class Selector:
         return self.value
 
     def is_xpath(self) -> bool:
-        return self.type == SelectorType.XPATH
+        return self.type is SelectorType.XPATH
 
     def is_css(self) -> bool:
-        return self.type == SelectorType.CSS
+        return self.type is SelectorType.CSS
+
+    def is_text(self) -> bool:
+        return self.type is SelectorType.TEXT
 
     def get_timeout(self) -> Optional[int]:
         return self.timeout
 
     def __str__(self) -> str:
-        return f"{self.type.value}-{self.value}"
+        return _format_str(self.type, self.value)
 
     def __repr__(self) -> str:
-        return f"Selector(type={self.type}, value={self.value})"
+        return _format_repr(self.type, self.value)
+
+
+# Selectors are immutable, so their string forms are formatted once per
+# (type, value) rather than on every log line or error message
+@lru_cache(maxsize=1024)
+def _format_str(selector_type: SelectorType, value: str) -> str:
+    return f"{_TYPE_STR[selector_type]}-{value}"
+
+
+@lru_cache(maxsize=1024)
+def _format_repr(selector_type: SelectorType, value: str) -> str:
+    return f"Selector(type={selector_type}, value={value})"
+
+
+@lru_cache(maxsize=1024)
+def _cached_selector(selector_type: SelectorType, value: str) -> Selector:
+    return Selector(type=selector_type, value=value)
+
+
+def _selector_from_tuple(item: Tuple[str, str]) -> Optional[Selector]:
+    if len(item) != 2:
+        return None
+    selector_value, selector_type = item
+    return _cached_selector(_to_selector_type(selector_type), selector_value)
 
 
 class SelectorGroup:
@@ -56,6 +109,8 @@ class SelectorGroup:
     If one selector fails, the next one will be tried.
     """
 
+    __slots__ = ("_name", "_selectors", "_failure_message")
+
     def __init__(self, name: str, *selectors: Union[Selector, str, Tuple[str, str]]):
         """
         Initialize a selector group with a name and selectors.
@@ -67,72 +122,159 @@ class SelectorGroup:
                 - Strings (assumed to be CSS selectors)
                 - Tuples of (value, type)
         """
-        self.name = name
-        self.selectors: List[Selector] = []
-
+        # sys.intern rejects str subclasses such as str-backed Enum members
+        self._name = sys.intern(name) if type(name) is str else name
+        normalized_selectors: List[Selector] = []
         for selector in selectors:
             if isinstance(selector, Selector):
-                self.selectors.append(selector)
+                normalized_selectors.append(selector)
             elif isinstance(selector, str):
-                self.selectors.append(Selector(type=SelectorType.CSS, value=selector))
-            elif isinstance(selector, tuple) and len(selector) == 2:
-                selector_value, selector_type = selector
-                if isinstance(selector_type, str):
-                    selector_type = SelectorType(selector_type)
-                self.selectors.append(
-                    Selector(type=selector_type, value=selector_value)
-                )
+                normalized_selectors.append(css(selector))
+            elif isinstance(selector, tuple):
+                normalized = _selector_from_tuple(selector)
+                if normalized is not None:
+                    normalized_selectors.append(normalized)
+        self._selectors: Tuple[Selector, ...] = tuple(normalized_selectors)
+        # Safe to precompute because name is read-only after construction
+        self._failure_message = f"All selectors in group '{self._name}' failed"
+
+    # Read-only, since groups hash on their name and selectors
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def selectors(self) -> Tuple[Selector, ...]:
+        return self._selectors
 
     async def execute(
-        self, find_element: Callable[[Selector], Awaitable[Result[T, Exception]]]
+        self,
+        find_element: Callable[
+            [Selector], Union[Awaitable[Result[T, Exception]], Result[T, Exception]]
+        ],
     ) -> Result[T, Exception]:
         """
         Try selectors in order until one succeeds
 
         Args:
-            find_element: Function that takes a selector and returns a Result with the found element
+            find_element: Function that takes a selector and returns a Result with the found element.
+                May be synchronous, in which case its results are used without awaiting.
 
         Returns:
             Result containing either the found element or an exception
         """
-        for selector in self.selectors:
-            result = await find_element(selector)
+        last_error: Optional[Exception] = None
+        for selector in self._selectors:
+            outcome = find_element(selector)
+            # Result is itself awaitable, so check for it explicitly
+            if isinstance(outcome, Result):
+                result = outcome
+            else:
+                result = await outcome
             if result.is_ok():
                 return result
+            last_error = result.error
+
+        return self._failure(last_error)
+
+    async def execute_parallel(
+        self,
+        find_element: Callable[
+            [Selector], Union[Awaitable[Result[T, Exception]], Result[T, Exception]]
+        ],
+    ) -> Result[T, Exception]:
+        """
+        Try all selectors concurrently and return the first one to succeed
+
+        Unlike ``execute``, the result comes from whichever selector succeeds
+        first rather than the earliest one in the group, so latency is bounded
+        by the slowest selector instead of the sum of all of them. Remaining
+        lookups are cancelled as soon as one succeeds.
+
+        Args:
+            find_element: Function that takes a selector and returns a Result with the found element.
+                May be synchronous, in which case its results count as completed immediately.
 
-        return Error(Exception(f"All selectors in group '{self.name}' failed"))
+        Returns:
+            Result containing either the found element or an exception
+        """
+        if len(self._selectors) < 2:
+            # Nothing to race, skip the task and cancellation machinery
+            return await self.execute(find_element)
+
+        last_error: Optional[Exception] = None
+        tasks: List["asyncio.Future[Result[T, Exception]]"] = []
+        try:
+            for selector in self._selectors:
+                outcome = find_element(selector)
+                # Result is itself awaitable, so check for it explicitly
+                if isinstance(outcome, Result):
+                    if outcome.is_ok():
+                        return outcome
+                    last_error = outcome.error
+                else:
+                    tasks.append(asyncio.ensure_future(outcome))
+
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                if result.is_ok():
+                    return result
+                last_error = result.error
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return self._failure(last_error)
+
+    def _failure(self, last_error: Optional[Exception]) -> Result[T, Exception]:
+        """Build the error returned when no selector in the group matched"""
+        if last_error is None:
+            return Error(Exception(self._failure_message))
+        return Error(Exception(f"{self._failure_message}: {last_error}"))
     
     def __iter__(self) -> Iterator[Selector]:
-        return iter(self.selectors)
+        return iter(self._selectors)
     
     def __len__(self) -> int:
-        return len(self.selectors)
+        return len(self._selectors)
     
     def __getitem__(self, index: int) -> Selector:
-        return self.selectors[index]
+        return self._selectors[index]
     
     def __contains__(self, item: Selector) -> bool:
-        return item in self.selectors
+        return item in self._selectors
     
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SelectorGroup):
+            return NotImplemented
+        return self._name == other._name and self._selectors == other._selectors
+
+    def __hash__(self) -> int:
+        return hash((self._name, self._selectors))
+
     def __repr__(self) -> str:
-        return f"SelectorGroup(name={self.name}, selectors={self.selectors})"
+        return f"SelectorGroup(name={self._name}, selectors={self._selectors})"
     
     def __str__(self) -> str:
-        return f"SelectorGroup(name={self.name}, selectors={self.selectors})"
+        return f"SelectorGroup(name={self._name}, selectors={self._selectors})"
     
     
 
 
-class css(Selector):
-    def __init__(self, value: str):
-        super().__init__(type=SelectorType.CSS, value=value)
+@lru_cache(maxsize=1024)
+def css(value: str, timeout: Optional[int] = None) -> Selector:
+    """Create a CSS selector, reusing the cached instance for repeated values"""
+    return Selector(type=SelectorType.CSS, value=value, timeout=timeout)
 
 
-class xpath(Selector):
-    def __init__(self, value: str):
-        super().__init__(type=SelectorType.XPATH, value=value)
+@lru_cache(maxsize=1024)
+def xpath(value: str, timeout: Optional[int] = None) -> Selector:
+    """Create an XPath selector, reusing the cached instance for repeated values"""
+    return Selector(type=SelectorType.XPATH, value=value, timeout=timeout)
 
 
-class text(Selector):
-    def __init__(self, value: str):
-        super().__init__(type=SelectorType.TEXT, value=value)
+@lru_cache(maxsize=1024)
+def text(value: str, timeout: Optional[int] = None) -> Selector:
+    """Create a text selector, reusing the cached instance for repeated values"""
+    return Selector(type=SelectorType.TEXT, value=value, timeout=timeout)
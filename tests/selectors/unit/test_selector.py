@@ -1,3 +1,8 @@
+import asyncio
+import sys
+from dataclasses import asdict, fields
+from enum import Enum
+
 import pytest
 from expression import Error, Ok
 
@@ -27,6 +32,16 @@ class TestSelector:
         assert selector.get_timeout() == 10
         assert selector.is_css() is True
         assert selector.is_xpath() is False
+        assert selector.is_text() is False
+
+    def test_selector_type_string_is_normalized(self):
+        selector = Selector(type="xpath", value="//div")  # type: ignore[arg-type]
+
+        assert selector.type is SelectorType.XPATH
+        assert selector.is_xpath() is True
+
+        with pytest.raises(ValueError):
+            Selector(type="not-a-type", value="//div")  # type: ignore[arg-type]
 
     def test_selector_string_representation(self):
         selector = Selector(type=SelectorType.CSS, value=".my-class")
@@ -34,6 +49,18 @@ class TestSelector:
         assert str(selector) == "css-.my-class"
         assert repr(selector) == "Selector(type=SelectorType.CSS, value=.my-class)"
 
+    def test_selector_string_representation_is_cached(self):
+        selector = Selector(type=SelectorType.CSS, value=".my-class")
+
+        assert str(selector) is str(selector)
+        assert repr(selector) is repr(selector)
+        assert [f.name for f in fields(Selector)] == ["type", "value", "timeout"]
+        assert asdict(selector) == {
+            "type": SelectorType.CSS,
+            "value": ".my-class",
+            "timeout": None,
+        }
+
     def test_specialized_selectors(self):
         css_selector = css(".my-class")
         xpath_selector = xpath("//div[@class='my-class']")
@@ -48,6 +75,26 @@ class TestSelector:
         assert text_selector.type == SelectorType.TEXT
         assert text_selector.value == "Find me"
 
+    def test_specialized_selectors_are_cached(self):
+        assert css(".my-class") is css(".my-class")
+        assert css(".my-class", 5) is not css(".my-class")
+        assert css(".my-class").timeout is None
+        assert css(".my-class", 5).timeout == 5
+
+    def test_selector_is_immutable(self):
+        selector = css(".my-class")
+
+        with pytest.raises(AttributeError):
+            selector.value = ".other"  # type: ignore[misc]
+
+        assert selector == Selector(type=SelectorType.CSS, value=".my-class")
+        assert hash(selector) == hash(Selector(type=SelectorType.CSS, value=".my-class"))
+
+    def test_selector_has_no_instance_dict(self):
+        selector = Selector(type=SelectorType.CSS, value=".my-class")
+
+        assert not hasattr(selector, "__dict__")
+
 
 class TestSelectorGroup:
     def test_selector_group_constructor(self):
@@ -61,6 +108,44 @@ class TestSelectorGroup:
         assert group.selectors[0] == selector1
         assert group.selectors[1] == selector2
 
+    def test_selector_group_name_is_interned(self):
+        name = "".join(["test", "-", "group"])
+
+        group = SelectorGroup(name, css(".class1"))
+
+        assert group.name is sys.intern("test-group")
+        assert not hasattr(group, "__dict__")
+
+    def test_selector_group_accepts_str_enum_name(self):
+        class GroupName(str, Enum):
+            TITLE = "title"
+
+        group = SelectorGroup(GroupName.TITLE, ".a")
+
+        assert group.name is GroupName.TITLE
+        assert group.name == "title"
+
+    def test_selector_group_is_hashable(self):
+        group = SelectorGroup("test-group", css(".class1"), ("//div", "xpath"))
+        same = SelectorGroup("test-group", ".class1", xpath("//div"))
+
+        assert isinstance(group.selectors, tuple)
+        assert group == same
+        assert hash(group) == hash(same)
+        assert group != SelectorGroup("other-group", ".class1", xpath("//div"))
+        assert {group: "cached"}[same] == "cached"
+
+    def test_selector_group_is_read_only(self):
+        group = SelectorGroup("test-group", css(".class1"))
+        cache = {group: "cached"}
+
+        with pytest.raises(AttributeError):
+            group.name = "other-group"  # type: ignore[misc]
+        with pytest.raises(AttributeError):
+            group.selectors = (css(".class2"),)  # type: ignore[misc]
+
+        assert group in cache
+
     def test_selector_group_create(self):
         selector1 = css(".class1")
         selector2 = xpath("//div[@id='id1']")
@@ -96,6 +181,28 @@ class TestSelectorGroup:
         assert group.selectors[3].type == SelectorType.TEXT
         assert group.selectors[3].value == "Button text"
 
+    def test_selector_group_accepts_subclassed_inputs(self):
+        class SelectorString(str):
+            pass
+
+        group = SelectorGroup("subclass-group", SelectorString(".class1"), 42)  # type: ignore[arg-type]
+        again = SelectorGroup("subclass-group", SelectorString(".class1"), 42)  # type: ignore[arg-type]
+
+        assert len(group.selectors) == 1
+        assert group.selectors[0] == css(".class1")
+        assert again.selectors == group.selectors
+
+    def test_selector_group_reuses_cached_selectors(self):
+        group = SelectorGroup("cached-group", ".class1", ("//div", "xpath"))
+        again = SelectorGroup("cached-group", ".class1", ("//div", "xpath"))
+
+        assert group.selectors[0] is css(".class1")
+        assert group.selectors[1] is again.selectors[1]
+
+    def test_selector_group_unknown_type_string(self):
+        with pytest.raises(ValueError):
+            SelectorGroup("bad-group", ("//div", "not-a-type"))
+
     @pytest.mark.asyncio
     async def test_selector_group_execute(self):
         selector1 = css(".not-found")
@@ -115,6 +222,20 @@ class TestSelectorGroup:
         value = result.default_value(None)
         assert value == "Found element"
 
+    @pytest.mark.asyncio
+    async def test_selector_group_execute_sync_find_element(self):
+        group = SelectorGroup("test-group", css(".not-found"), css(".found"))
+
+        def mock_find_element(selector: Selector):
+            if selector.value == ".not-found":
+                return Error(Exception("Element not found"))
+            return Ok("Found element")
+
+        result = await group.execute(mock_find_element)
+
+        assert result.is_ok()
+        assert result.default_value(None) == "Found element"
+
     @pytest.mark.asyncio
     async def test_selector_group_execute_all_fail(self):
         selector1 = css(".not-found1")
@@ -129,3 +250,107 @@ class TestSelectorGroup:
 
         assert result.is_error()
         assert "All selectors in group 'test-group' failed" in str(result.error)
+
+    @pytest.mark.asyncio
+    async def test_selector_group_execute_reports_last_error(self):
+        group = SelectorGroup("test-group", css(".not-found1"), css(".not-found2"))
+
+        async def mock_find_element(selector: Selector):
+            return Error(Exception(f"{selector.value} not found"))
+
+        result = await group.execute(mock_find_element)
+
+        assert result.is_error()
+        assert str(result.error) == (
+            "All selectors in group 'test-group' failed: .not-found2 not found"
+        )
+
+    @pytest.mark.asyncio
+    async def test_empty_selector_group_execute(self):
+        group = SelectorGroup("empty-group")
+
+        async def mock_find_element(selector: Selector):
+            return Ok("Found element")
+
+        result = await group.execute(mock_find_element)
+
+        assert result.is_error()
+        assert str(result.error) == "All selectors in group 'empty-group' failed"
+
+    @pytest.mark.asyncio
+    async def test_selector_group_execute_parallel(self):
+        selector1 = css(".slow")
+        selector2 = xpath("//div[@id='fast']")
+        cancelled = []
+
+        group = SelectorGroup("test-group", selector1, selector2)
+
+        async def mock_find_element(selector: Selector):
+            if selector.value == ".slow":
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(selector)
+                    raise
+                return Ok("Slow element")
+            return Ok("Fast element")
+
+        result = await asyncio.wait_for(group.execute_parallel(mock_find_element), 1)
+
+        assert result.is_ok()
+        assert result.default_value(None) == "Fast element"
+        assert cancelled == [selector1]
+
+    @pytest.mark.asyncio
+    async def test_selector_group_execute_parallel_single_selector(self):
+        group = SelectorGroup("test-group", css(".not-found"))
+
+        async def mock_find_element(selector: Selector):
+            return Error(Exception("Element not found"))
+
+        result = await group.execute_parallel(mock_find_element)
+
+        assert result.is_error()
+        assert str(result.error) == (
+            "All selectors in group 'test-group' failed: Element not found"
+        )
+
+    @pytest.mark.asyncio
+    async def test_selector_group_execute_parallel_sync_find_element(self):
+        group = SelectorGroup("test-group", css(".not-found"), css(".found"), css(".other"))
+
+        def mock_find_element(selector: Selector):
+            if selector.value == ".found":
+                return Ok("Found element")
+            return Error(Exception("Element not found"))
+
+        result = await group.execute_parallel(mock_find_element)
+
+        assert result.is_ok()
+        assert result.default_value(None) == "Found element"
+
+    @pytest.mark.asyncio
+    async def test_selector_group_execute_parallel_sync_all_fail(self):
+        group = SelectorGroup("test-group", css(".not-found1"), css(".not-found2"))
+
+        def mock_find_element(selector: Selector):
+            return Error(Exception(f"{selector.value} not found"))
+
+        result = await group.execute_parallel(mock_find_element)
+
+        assert result.is_error()
+        assert str(result.error) == (
+            "All selectors in group 'test-group' failed: .not-found2 not found"
+        )
+
+    @pytest.mark.asyncio
+    async def test_selector_group_execute_parallel_all_fail(self):
+        group = SelectorGroup("test-group", css(".not-found1"), css(".not-found2"))
+
+        async def mock_find_element(selector: Selector):
+            return Error(Exception("Element not found"))
+
+        result = await group.execute_parallel(mock_find_element)
+
+        assert result.is_error()
+        assert "All selectors in group 'test-group' failed" in str(result.error)